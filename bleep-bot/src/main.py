@@ -10,6 +10,8 @@ from src.models.user import db
 from src.routes.user import user_bp
 from src.routes.video_processor import video_bp, load_model_on_startup
 from src.routes.history import history_bp
+from src.routes.search import search_bp
+from src.models.transcript import init_transcript_index
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = 'asdf#FGSgvasgf$5$WGT'
@@ -19,6 +21,7 @@ CORS(app)
 app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(video_bp, url_prefix='/api/video')
 app.register_blueprint(history_bp, url_prefix='/api')
+app.register_blueprint(search_bp, url_prefix='/api')
 
 # Enable the database
 app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
@@ -26,6 +29,7 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db.init_app(app)
 with app.app_context():
     db.create_all()
+    init_transcript_index()
 
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
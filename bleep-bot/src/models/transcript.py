@@ -0,0 +1,162 @@
+# File: bleep-bot/src/models/transcript.py
+
+import re
+import json
+import numpy as np
+from sqlalchemy import text
+from .user import db
+
+# Timestamps are stored as little-endian uint32 milliseconds and confidences as
+# float64 (Whisper's own precision, so threshold comparisons match processing),
+# one entry per word, so a job's timing data is three small blobs.
+TIMESTAMP_DTYPE = np.dtype('<u4')
+CONFIDENCE_DTYPE = np.dtype('<f8')
+
+# Transcripts loaded from the database per query while scanning FTS candidates
+SEARCH_BATCH_SIZE = 200
+
+# Matches returned per job by a search; `match_count` still reports them all
+MAX_MATCHES_PER_JOB = 100
+
+
+def normalize_word(word):
+    """Normalizes a Whisper word the same way the profanity detector does."""
+    return re.sub(r'[^\w\s]', '', word).strip().lower()
+
+
+class Transcript(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('job.id'), unique=True, nullable=False)
+    tokens = db.Column(db.Text, nullable=False, default='[]')  # JSON list of normalized words
+    texts = db.Column(db.Text, nullable=False, default='[]')  # JSON list of the original Whisper words
+    starts_ms = db.Column(db.LargeBinary, nullable=False, default=b'')
+    ends_ms = db.Column(db.LargeBinary, nullable=False, default=b'')
+    confidences = db.Column(db.LargeBinary, nullable=False, default=b'')
+
+    job = db.relationship('Job', backref=db.backref('transcript', uselist=False))
+
+    def decode(self):
+        """Decodes the stored columns once: (tokens, texts, starts_ms, ends_ms, confidences)."""
+        return (json.loads(self.tokens), json.loads(self.texts),
+                np.frombuffer(self.starts_ms, dtype=TIMESTAMP_DTYPE),
+                np.frombuffer(self.ends_ms, dtype=TIMESTAMP_DTYPE),
+                np.frombuffer(self.confidences, dtype=CONFIDENCE_DTYPE))
+
+    def to_transcription(self):
+        """Rebuilds a Whisper-style transcription dict so the profanity detector can run on it."""
+        tokens, texts, starts, ends, confidences = self.decode()
+        words = [{'word': texts[i], 'start': float(starts[i]) / 1000, 'end': float(ends[i]) / 1000,
+                  'probability': float(confidences[i])} for i in range(len(tokens))]
+        return {'segments': [{'words': words}]}
+
+    def find_phrases(self, phrases):
+        """
+        Finds every occurrence of the given token sequences in one pass over the transcript.
+        `phrases` maps a display string to its list of tokens.
+        """
+        tokens, texts, starts, ends, confidences = self.decode()
+        by_first = {}
+        for phrase, phrase_tokens in phrases.items():
+            by_first.setdefault(phrase_tokens[0], []).append((phrase, phrase_tokens))
+
+        matches = []
+        for i, token in enumerate(tokens):
+            for phrase, phrase_tokens in by_first.get(token, ()):
+                end = i + len(phrase_tokens)
+                if tokens[i:end] == phrase_tokens:
+                    matches.append({
+                        'word': phrase, 'text': ''.join(texts[i:end]).strip(),
+                        'start_ms': int(starts[i]), 'end_ms': int(ends[end - 1]),
+                        'confidence': float(confidences[i:end].min())
+                    })
+        return matches
+
+
+def init_transcript_index():
+    """
+    Creates the FTS5 table used to find which jobs mention a word. Rowids are job ids.
+    It is contentless: the words already live in `Transcript.tokens`, only the index is kept.
+    """
+    db.session.execute(text("CREATE VIRTUAL TABLE IF NOT EXISTS transcript_fts USING fts5(words, content='')"))
+    db.session.commit()
+
+
+def index_transcription(job, transcription):
+    """Stores the word-level timestamps of a Whisper transcription for a job. Does not commit."""
+    tokens, texts, starts, ends, confidences = [], [], [], [], []
+    for segment in transcription.get('segments', []):
+        for word_info in segment.get('words', []):
+            word_text_clean = normalize_word(word_info.get('word', ''))
+            if not word_text_clean: continue
+            tokens.append(word_text_clean)
+            texts.append(word_info['word'])
+            starts.append(round(word_info['start'] * 1000))
+            ends.append(round(word_info['end'] * 1000))
+            confidences.append(word_info.get('probability', 1.0))
+
+    transcript = Transcript(
+        job_id=job.id, tokens=json.dumps(tokens), texts=json.dumps(texts),
+        starts_ms=np.asarray(starts, dtype=TIMESTAMP_DTYPE).tobytes(),
+        ends_ms=np.asarray(ends, dtype=TIMESTAMP_DTYPE).tobytes(),
+        confidences=np.asarray(confidences, dtype=CONFIDENCE_DTYPE).tobytes()
+    )
+    db.session.add(transcript)
+    db.session.execute(text("INSERT INTO transcript_fts (rowid, words) VALUES (:job_id, :words)"),
+                       {'job_id': job.id, 'words': ' '.join(tokens)})
+    return transcript
+
+
+def _fts_phrase(phrase):
+    return '"' + phrase.replace('"', '""') + '"'
+
+
+def iter_candidate_transcripts(phrases):
+    """
+    Yields the transcripts whose FTS entry matches any of the phrases, in job id order.
+    FTS only narrows the library down; callers still do the exact matching.
+    """
+    phrases = [phrase for phrase in phrases if phrase.strip()]
+    if not phrases: return
+
+    query = ' OR '.join(_fts_phrase(phrase) for phrase in phrases)
+    job_ids = [row[0] for row in db.session.execute(
+        text("SELECT rowid FROM transcript_fts WHERE transcript_fts MATCH :query ORDER BY rowid"),
+        {'query': query})]
+
+    for i in range(0, len(job_ids), SEARCH_BATCH_SIZE):
+        batch = job_ids[i:i + SEARCH_BATCH_SIZE]
+        yield from Transcript.query.options(db.joinedload(Transcript.job)) \
+            .filter(Transcript.job_id.in_(batch)).order_by(Transcript.job_id).all()
+
+
+def parse_search_phrases(phrases):
+    """Normalizes search phrases into a dict of display string -> tokens, dropping empty ones."""
+    phrase_tokens = {}
+    for phrase in phrases:
+        tokens = [token for token in (normalize_word(part) for part in phrase.split()) if token]
+        if tokens: phrase_tokens[' '.join(tokens)] = tokens
+    return phrase_tokens
+
+
+def search_transcripts(phrases, limit=None, offset=0, max_matches=MAX_MATCHES_PER_JOB):
+    """
+    Finds the indexed jobs containing any of the given words or phrases.
+    Returns (results, has_more) where results is a list of (transcript, match_count, matches),
+    matches being the first `max_matches` occurrences with millisecond timestamps.
+    `limit` and `offset` apply to matching jobs.
+    """
+    phrase_tokens = parse_search_phrases(phrases)
+    if not phrase_tokens: return [], False
+
+    results = []
+    skipped = 0
+    for transcript in iter_candidate_transcripts(list(phrase_tokens)):
+        matches = transcript.find_phrases(phrase_tokens)
+        if not matches: continue
+        if skipped < offset:
+            skipped += 1
+            continue
+        if limit is not None and len(results) >= limit: return results, True
+        matches.sort(key=lambda match: match['start_ms'])
+        results.append((transcript, len(matches), matches[:max_matches]))
+    return results, False
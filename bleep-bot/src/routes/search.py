@@ -0,0 +1,61 @@
+# File: bleep-bot/src/routes/search.py
+
+from flask import Blueprint, request, jsonify
+from ..models.transcript import parse_search_phrases, search_transcripts, iter_candidate_transcripts
+from .video_processor import processor, DEFAULT_FILTER_SETTINGS
+
+search_bp = Blueprint('search', __name__)
+
+DEFAULT_SEARCH_LIMIT = 50
+MAX_SEARCH_LIMIT = 500
+
+def get_page_args():
+    limit = min(max(request.args.get('limit', DEFAULT_SEARCH_LIMIT, type=int), 1), MAX_SEARCH_LIMIT)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    return limit, offset
+
+@search_bp.route('/search', methods=['GET'])
+def search():
+    """Returns the jobs whose transcripts contain any of the `q` words, with timestamps in milliseconds."""
+    try:
+        phrases = [phrase for value in request.args.getlist('q') for phrase in value.split(',')]
+        if not parse_search_phrases(phrases): return jsonify({'error': 'No search terms provided'}), 400
+
+        limit, offset = get_page_args()
+        found, has_more = search_transcripts(phrases, limit=limit, offset=offset)
+        results = [{'job': transcript.job.to_dict(), 'match_count': match_count, 'matches': matches}
+                   for transcript, match_count, matches in found]
+        return jsonify({'success': True, 'results': results, 'limit': limit, 'offset': offset, 'has_more': has_more})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@search_bp.route('/search/rescan', methods=['POST'])
+def rescan():
+    """
+    Runs the profanity detector with the given filter settings over the stored transcripts,
+    without running Whisper again. Jobs are not modified: their counts describe what was
+    muted in the rendered video, so the detections are only returned.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        settings = DEFAULT_FILTER_SETTINGS.copy()
+        settings.update(data.get('filter_settings', {}))
+        limit, offset = get_page_args()
+
+        results = []
+        skipped = 0
+        has_more = False
+        for transcript in iter_candidate_transcripts(processor.get_active_word_list(settings)):
+            segments = processor.detect_profanity_precise(transcript.to_transcription(), settings)
+            if not segments: continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            if len(results) >= limit:
+                has_more = True
+                break
+            results.append({'job': transcript.job.to_dict(), 'profanity_detected': len(segments), 'segments': segments})
+
+        return jsonify({'success': True, 'results': results, 'limit': limit, 'offset': offset, 'has_more': has_more})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -58,7 +58,7 @@ class VideoProcessor:
     
     def detect_profanity_precise(self, transcription, filter_settings):
         profanity_segments = []
-        active_words = self.get_active_word_list(filter_settings)
+        active_words = set(self.get_active_word_list(filter_settings))
         word_padding = filter_settings.get('word_padding', 0.25)
         confidence_threshold = filter_settings.get('confidence_threshold', 0.75)
 
@@ -130,6 +130,7 @@ def process_video():
         # --- Import the new Job model and db instance ---
         from ..models.job import Job
         from ..models.user import db
+        from ..models.transcript import index_transcription
 
         video_path = os.path.join(processor.temp_dir, file_id)
         if not os.path.exists(video_path): return jsonify({'error': 'Video file not found'}), 404
@@ -160,6 +161,14 @@ def process_video():
         db.session.add(new_job)
         db.session.commit()
 
+        # --- Keep the word timestamps so the library can be searched later ---
+        try:
+            index_transcription(new_job, transcription)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"Failed to index transcript for job {new_job.id}: {e}")
+
         return jsonify({
             'success': True, 'profanity_detected': len(profanity_segments),
             'segments': profanity_segments, 'clean_file_id': clean_filename, 'message': message
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the transcript index, search and rescan logic.
+Uses an in-memory database and hand-built Whisper-style transcriptions, so no model or ffmpeg is needed.
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+
+from flask import Flask
+from sqlalchemy import event
+from src.models.user import db
+from src.models.job import Job
+from src.models.transcript import init_transcript_index, index_transcription, search_transcripts
+from src.routes.search import search_bp
+from src.routes.video_processor import processor, DEFAULT_FILTER_SETTINGS
+
+def make_transcription(words):
+    """Builds a Whisper-style transcription from (word, start, end, probability) tuples."""
+    return {'segments': [{'words': [
+        {'word': word, 'start': start, 'end': end, 'probability': probability}
+        for word, start, end, probability in words
+    ]}]}
+
+JOB_TRANSCRIPTIONS = {
+    'a_first.mp4': make_transcription([
+        (' Oh', 0.0, 0.3, 0.99), (' Jesus', 0.3, 0.72, 0.95), (' Christ!', 0.72, 1.1, 0.9),
+        (' holy', 2.0, 2.2, 0.9), (' shit,', 2.2, 2.5, 0.88), (' what', 2.5, 2.7, 0.99),
+        (' the', 2.7, 2.8, 0.99), (' hell.', 2.8, 3.14, 0.74999999)
+    ]),
+    'b_second.mp4': make_transcription([
+        (' Darn', 1.0, 1.25, 0.97), (' it,', 1.25, 1.4, 0.99), (' hell', 4.0, 4.3, 0.8)
+    ]),
+    'c_third.mp4': make_transcription([(' A', 0.0, 0.1, 0.99), (' nice', 0.1, 0.4, 0.99), (' day', 0.4, 0.8, 0.99)])
+}
+
+def create_app():
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    app.register_blueprint(search_bp, url_prefix='/api')
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        init_transcript_index()
+        for filename, transcription in JOB_TRANSCRIPTIONS.items():
+            count = len(processor.detect_profanity_precise(transcription, DEFAULT_FILTER_SETTINGS))
+            job = Job(original_filename=filename, profanity_detected_count=count)
+            db.session.add(job)
+            db.session.flush()
+            index_transcription(job, transcription)
+        db.session.commit()
+    return app
+
+def test_timestamp_round_trip():
+    """Stored timestamps and confidences decode back to the transcription values"""
+    app = create_app()
+    with app.app_context():
+        job = Job.query.filter_by(original_filename='a_first.mp4').one()
+        tokens, texts, starts, ends, confidences = job.transcript.decode()
+        words = JOB_TRANSCRIPTIONS['a_first.mp4']['segments'][0]['words']
+
+        assert tokens == ['oh', 'jesus', 'christ', 'holy', 'shit', 'what', 'the', 'hell']
+        assert texts == [word['word'] for word in words]
+        assert starts.tolist() == [round(word['start'] * 1000) for word in words]
+        assert ends.tolist() == [round(word['end'] * 1000) for word in words]
+        assert confidences.tolist() == [word['probability'] for word in words]
+
+def test_phrase_matching_across_tokens():
+    """A multi-word phrase spans consecutive words and keeps the original text"""
+    app = create_app()
+    with app.app_context():
+        results, has_more = search_transcripts(['Jesus Christ'])
+        assert len(results) == 1 and not has_more
+        transcript, match_count, matches = results[0]
+        assert transcript.job.original_filename == 'a_first.mp4'
+        assert match_count == 1
+        assert matches == [{'word': 'jesus christ', 'text': 'Jesus Christ!', 'start_ms': 300, 'end_ms': 1100,
+                            'confidence': 0.9}]
+
+def test_search_prefilters_jobs():
+    """Only jobs containing the word are returned, in job order, with limit and offset"""
+    app = create_app()
+    with app.app_context():
+        def filenames(*args, **kwargs):
+            results, has_more = search_transcripts(*args, **kwargs)
+            return [transcript.job.original_filename for transcript, _, _ in results], has_more
+
+        assert filenames(['hell']) == (['a_first.mp4', 'b_second.mp4'], False)
+        assert filenames(['hell'], limit=1) == (['a_first.mp4'], True)
+        assert filenames(['hell'], limit=1, offset=1) == (['b_second.mp4'], False)
+        assert filenames(['nice hell']) == ([], False)
+        assert filenames(['goddamn']) == ([], False)
+        assert filenames(['?!']) == ([], False)
+
+def test_search_caps_matches_per_job():
+    """Each job returns at most `max_matches` occurrences but counts them all"""
+    app = create_app()
+    with app.app_context():
+        results, _ = search_transcripts(['hell', 'the', 'oh'], max_matches=2)
+        transcript, match_count, matches = results[0]
+        assert match_count == 3
+        assert [match['word'] for match in matches] == ['oh', 'the']
+
+def test_search_loads_jobs_in_batch():
+    """Jobs are loaded with their transcripts rather than one query per result"""
+    app = create_app()
+    client = app.test_client()
+    with app.app_context():
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', listener)
+        try:
+            response = client.get('/api/search?q=hell')
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', listener)
+
+    assert len(response.get_json()['results']) == 2
+    assert len(statements) == 2  # FTS lookup + one transcript/job batch
+
+def test_search_endpoint():
+    """The search API splits comma-separated terms and rejects empty queries"""
+    client = create_app().test_client()
+
+    response = client.get('/api/search?q=darn,day')
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [result['job']['original_filename'] for result in results] == ['second.mp4', 'third.mp4']
+    assert results[0]['matches'][0]['start_ms'] == 1000
+    assert results[0]['match_count'] == 1
+    assert response.get_json()['has_more'] is False
+
+    response = client.get('/api/search?q=hell&limit=1')
+    assert [result['job']['original_filename'] for result in response.get_json()['results']] == ['first.mp4']
+    assert response.get_json()['has_more'] is True
+
+    for query in ['', '?q=,', '?q=%22', '?q=%3F!']:
+        assert client.get(f'/api/search{query}').status_code == 400
+
+def test_rescan_matches_processing():
+    """Rescanning with the processing settings finds exactly what processing found, and changes no job"""
+    app = create_app()
+    client = app.test_client()
+
+    # The body is optional
+    bare_response = client.post('/api/search/rescan')
+    assert bare_response.status_code == 200
+
+    response = client.post('/api/search/rescan', json={})
+    assert response.status_code == 200
+    assert response.get_json() == bare_response.get_json()
+    results = {result['job']['original_filename']: result for result in response.get_json()['results']}
+
+    for filename, transcription in JOB_TRANSCRIPTIONS.items():
+        expected = processor.detect_profanity_precise(transcription, DEFAULT_FILTER_SETTINGS)
+        result = results.get(filename.split('_', 1)[-1])
+        if not expected:
+            assert result is None
+            continue
+        assert result['profanity_detected'] == len(expected)
+        assert [(s['word'], s['text'], s['confidence']) for s in result['segments']] == \
+            [(s['word'], s['text'], s['confidence']) for s in expected]
+        for segment, expected_segment in zip(result['segments'], expected):
+            assert abs(segment['start'] - expected_segment['start']) < 0.001
+            assert abs(segment['end'] - expected_segment['end']) < 0.001
+
+    # 'hell' at 0.74999999 stays below the default threshold, as during processing
+    assert 'hell' not in [segment['word'] for segment in results['first.mp4']['segments']]
+
+    response = client.post('/api/search/rescan', json={'filter_settings': {'enabled_categories': ['mild_language']}})
+    assert [result['job']['original_filename'] for result in response.get_json()['results']] == ['second.mp4']
+
+    with app.app_context():
+        for job in Job.query.all():
+            expected = processor.detect_profanity_precise(JOB_TRANSCRIPTIONS[job.original_filename], DEFAULT_FILTER_SETTINGS)
+            assert job.profanity_detected_count == len(expected)
+
+if __name__ == "__main__":
+    print("🔧 Testing Bleep Bot Transcript Index")
+    print("=" * 50)
+
+    tests = [test_timestamp_round_trip, test_phrase_matching_across_tokens, test_search_prefilters_jobs,
+             test_search_caps_matches_per_job, test_search_loads_jobs_in_batch, test_search_endpoint,
+             test_rescan_matches_processing]
+    success_count = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__doc__}")
+            success_count += 1
+        except AssertionError as e:
+            print(f"❌ {test.__doc__}: {e}")
+
+    print("\n" + "=" * 50)
+    print(f"Test Results: {success_count}/{len(tests)} tests passed")